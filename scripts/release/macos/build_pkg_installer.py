@@ -46,22 +46,32 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import functools
 import hashlib
+import json
 import os
+import platform
+import plistlib
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
-import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Iterable, Optional
+from xml.sax.saxutils import escape, quoteattr
 
 # Azure CLI project structure
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 SRC_DIR = PROJECT_ROOT / "src"
 AZURE_CLI_PACKAGE_DIR = SRC_DIR / "azure-cli"
 AZURE_CLI_CORE_DIR = SRC_DIR / "azure-cli-core"
+COMPONENT_DIRS = (
+    SRC_DIR / "azure-cli-telemetry",
+    AZURE_CLI_CORE_DIR,
+    AZURE_CLI_PACKAGE_DIR,
+)
 
 # Package configuration
 APP_NAME = "azure-cli"
@@ -70,6 +80,95 @@ INSTALL_PREFIX = "microsoft"  # /usr/local/microsoft/
 INSTALL_DIR = f"{INSTALL_PREFIX}/{APP_NAME}"  # Results in: microsoft/azure-cli
 PKG_IDENTIFIER = "com.microsoft.azure-cli"
 
+# Hand-maintained pkgbuild component property list for the static pkg_root layout
+COMPONENT_PLIST_PATH = Path(__file__).resolve().parent / "component.plist"
+
+# productbuild distribution definition; the layout is fixed, only the values vary.
+# Text values must be passed through escape() and *_attr values through quoteattr().
+_DIST_TEMPLATE = """\
+<?xml version="1.0" encoding="utf-8"?>
+<installer-gui-script minSpecVersion="2">
+  <title>Azure CLI {version}</title>
+  <pkg-ref id={pkg_id_attr}>{component_pkg}</pkg-ref>
+  <choices-outline>
+    <line choice="azure-cli-choice" />
+  </choices-outline>
+  <choice id="azure-cli-choice" title="Azure CLI" description={description_attr} start_selected="true">
+    <pkg-ref id={pkg_id_attr} />
+  </choice>
+</installer-gui-script>
+"""
+
+# Commands exercised after staging to verify the trimmed runtime still works
+SMOKE_TEST_COMMANDS = (
+    ("--version",),
+    ("--help",),
+    ("login", "--help"),
+    ("account", "--help"),
+    ("group", "create", "--help"),
+    ("vm", "list", "--help"),
+    ("storage", "account", "list", "--help"),
+)
+
+# Top-level site-packages entries that --prune-unused must never remove
+PRUNE_ALLOW_LIST = frozenset({"azure", "pip", "setuptools", "_distutils_hack", "pkg_resources", "certifi"})
+
+# Distributions whose installed dependency closure --prune-unused always keeps
+PRUNE_KEEP_DISTRIBUTIONS = ("azure-cli", "azure-cli-core", "azure-cli-telemetry")
+
+# Run with the bundled interpreter: prints the top-level import names of the given
+# distributions and everything they require, including requested extras, as a JSON list
+_DEPENDENCY_TOP_LEVEL_SCRIPT = r"""
+import json, sys
+from importlib import metadata
+
+try:
+    from packaging.requirements import Requirement
+    from packaging.utils import canonicalize_name
+except ImportError:
+    from pip._vendor.packaging.requirements import Requirement
+    from pip._vendor.packaging.utils import canonicalize_name
+
+# Each distribution is walked once per requested extra ("" is the base requirement set)
+pending = [(name, frozenset()) for name in sys.argv[1:]]
+seen = set()
+scanned = set()
+top_level = set()
+while pending:
+    name, extras = pending.pop()
+    key = canonicalize_name(name)
+    new_extras = {extra for extra in {"", *extras} if (key, extra) not in seen}
+    if not new_extras:
+        continue
+    seen.update((key, extra) for extra in new_extras)
+    try:
+        dist = metadata.distribution(key)
+    except metadata.PackageNotFoundError:
+        continue
+    for requirement in dist.requires or []:
+        req = Requirement(requirement)
+        if req.marker is None or any(req.marker.evaluate({"extra": extra}) for extra in new_extras):
+            pending.append((req.name, frozenset(canonicalize_name(extra) for extra in req.extras)))
+    if key in scanned:
+        continue
+    scanned.add(key)
+    names = (dist.read_text("top_level.txt") or "").split()
+    if not names:
+        for file in dist.files or []:
+            top = file.parts[0]
+            if top in ("..", "__pycache__") or top.endswith((".dist-info", ".egg-info", ".pth")):
+                continue
+            names.append(top.split(".", 1)[0])
+    top_level.update(names)
+print(json.dumps(sorted(top_level)))
+"""
+
+# Persistent pip cache shared across builds (override with PIP_CACHE_DIR)
+DEFAULT_PIP_CACHE_DIR = PROJECT_ROOT / ".pip-cache"
+
+# Built packages are reused across builds when AZ_PKG_CACHE_DIR is set
+PKG_CACHE_DIR_ENV = "AZ_PKG_CACHE_DIR"
+
 
 class BuildError(RuntimeError):
     """Raised when the packaging pipeline fails."""
@@ -113,17 +212,26 @@ def _detect_version() -> str:
 
     # Fall back to reading from azure-cli-core/__init__.py
     init_path = AZURE_CLI_CORE_DIR / "azure" / "cli" / "core" / "__init__.py"
+    version_pattern = re.compile(r'__version__\s*=\s*[\'"](.+?)[\'"]')
+    version = None
     try:
-        source = init_path.read_text(encoding="utf-8")
+        # __version__ = "x.y.z" sits near the top of the file, so stop at the first matching line
+        with init_path.open(encoding="utf-8") as fh:
+            for line in fh:
+                match = version_pattern.match(line)
+                if match:
+                    version = match.group(1)
+                    break
     except FileNotFoundError as exc:
         raise BuildError(f"Could not locate {init_path} to determine version") from exc
 
-    # Parse __version__ = "x.y.z"
-    match = re.search(r'__version__\s*=\s*[\'"](.+?)[\'"]', source)
-    if not match:
-        raise BuildError(f"Could not find __version__ in {init_path}")
+    if not version:
+        # Fall back to a full-file search for less conventional formatting
+        match = version_pattern.search(init_path.read_text(encoding="utf-8"))
+        if not match:
+            raise BuildError(f"Could not find __version__ in {init_path}")
+        version = match.group(1)
 
-    version = match.group(1)
     print(f"Using version from azure-cli-core: {version}")
     return version
 
@@ -146,15 +254,38 @@ def _ensure_clean(paths: Iterable[Path]) -> None:
             shutil.rmtree(path)
 
 
+def _pip_env() -> dict[str, str]:
+    """Environment for pip/uv invocations: persistent wheel cache, no bytecode we would prune anyway."""
+    pip_cache_dir = os.environ.get("PIP_CACHE_DIR", str(DEFAULT_PIP_CACHE_DIR))
+    return {
+        **os.environ,
+        "PIP_CACHE_DIR": pip_cache_dir,
+        # Nested under the pip cache so a single cached directory covers both installers
+        "UV_CACHE_DIR": os.environ.get("UV_CACHE_DIR", str(Path(pip_cache_dir) / "uv")),
+        "PYTHONDONTWRITEBYTECODE": "1",
+    }
+
+
+def _uv_executable() -> Optional[str]:
+    """Return the path to uv if it is available; it resolves and installs much faster than pip."""
+    return shutil.which("uv")
+
+
 def _create_virtualenv(venv_dir: Path) -> Path:
     """Create a virtual environment specifically for building the package."""
 
     _ensure_clean([venv_dir])
     print(f"Creating build virtual environment at {venv_dir}")
-    cmd = [sys.executable, "-m", "venv", "--copies", str(venv_dir)]
-    _run(cmd)
     python_path = _virtualenv_python(venv_dir)
-    _run([str(python_path), "-m", "pip", "install", "--upgrade", "pip", "setuptools", "wheel"])
+
+    # The venv is the shipped runtime, so it is always created with venv --copies (uv venv
+    # cannot copy the interpreter). pip is bootstrapped offline from the bundled wheel instead
+    # of upgrading pip/setuptools/wheel from PyPI; it must ship because az extension add/update
+    # uses it. Components are built in isolated environments, so no other toolchain is needed.
+    # ensurepip is not run with -I, which would ignore PYTHONDONTWRITEBYTECODE and be passed on
+    # to its pip child; the pip/setuptools bytecode pip compiles itself is pruned at staging.
+    _run([sys.executable, "-Im", "venv", "--copies", "--without-pip", str(venv_dir)])
+    _run([str(python_path), "-m", "ensurepip", "--altinstall"], env=_pip_env())
     return python_path
 
 
@@ -163,36 +294,99 @@ def _install_azure_cli(python_path: Path) -> None:
 
     print("Installing Azure CLI components...")
 
-    # Install in the correct order to satisfy dependencies
-    components = [
-        SRC_DIR / "azure-cli-telemetry",
-        SRC_DIR / "azure-cli-core",
-        SRC_DIR / "azure-cli",
-    ]
+    # Installed in a single pip invocation; the resolver orders them by dependency
+    components = COMPONENT_DIRS
 
     for component in components:
         if not component.exists():
             raise BuildError(f"Component directory not found: {component}")
 
-        print(f"  Installing {component.name}...")
-        _run([str(python_path), "-m", "pip", "install", str(component)])
+    print(f"  Installing {', '.join(component.name for component in components)}...")
+    uv = _uv_executable()
+    if uv:
+        cmd = [uv, "pip", "install", "--python", str(python_path)]
+    else:
+        cmd = [str(python_path), "-m", "pip", "install", "--no-compile"]
+    _run([*cmd, *(str(component) for component in components)], env=_pip_env())
 
     # Verify installation
     print("Verifying Azure CLI installation...")
-    result = _run([str(python_path), "-m", "azure.cli", "--version"], capture_output=True)
+    result = _run([str(python_path), "-B", "-m", "azure.cli", "--version"], capture_output=True)
     print(f"Installed Azure CLI version:\n{result.stdout}")
 
 
-def _prune_bytecode(root: Path) -> None:
-    """Remove Python bytecode files to reduce package size."""
-    for path in root.rglob("__pycache__"):
-        shutil.rmtree(path, ignore_errors=True)
-    for suffix in (".pyc", ".pyo"):
-        for file in root.rglob(f"*{suffix}"):
-            try:
-                file.unlink()
-            except FileNotFoundError:
-                pass
+def _tree_size(path: str) -> int:
+    """Total size in bytes of the regular files below path."""
+    size = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                size += _tree_size(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                size += entry.stat(follow_symlinks=False).st_size
+    return size
+
+
+def _scan_prune(path: str, skip: frozenset[str] = frozenset()) -> tuple[int, int]:
+    """Recursively remove bytecode below path, returning (kept_bytes, removed_bytes).
+
+    Entries whose path is in skip are left alone; they are pruned separately.
+    """
+    kept_bytes = 0
+    removed_bytes = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.path in skip:
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name == "__pycache__":
+                    removed_bytes += _tree_size(entry.path)
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                else:
+                    kept, removed = _scan_prune(entry.path, skip)
+                    kept_bytes += kept
+                    removed_bytes += removed
+            elif entry.is_file(follow_symlinks=False):
+                size = entry.stat(follow_symlinks=False).st_size
+                if entry.name.endswith((".pyc", ".pyo")):
+                    try:
+                        os.unlink(entry.path)
+                        removed_bytes += size
+                    except FileNotFoundError:
+                        pass
+                else:
+                    kept_bytes += size
+    return kept_bytes, removed_bytes
+
+
+def _prune_bytecode(root: Path) -> tuple[int, int]:
+    """Remove Python bytecode files to reduce package size.
+
+    Walks the tree with os.scandir so the cached DirEntry type information is
+    reused instead of issuing extra stat() calls per entry. Each top-level
+    site-packages directory is walked on its own thread, since the walk is
+    syscall-bound and releases the GIL. Returns the total size in bytes of the
+    files kept and removed.
+    """
+
+    parallel_dirs = []
+    for site_packages in root.glob("lib/python3.*/site-packages"):
+        with os.scandir(site_packages) as entries:
+            parallel_dirs.extend(
+                entry.path
+                for entry in entries
+                if entry.is_dir(follow_symlinks=False) and entry.name != "__pycache__"
+            )
+
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [executor.submit(_scan_prune, path) for path in parallel_dirs]
+        # The rest of the tree, including top-level site-packages files, is handled here
+        kept_bytes, removed_bytes = _scan_prune(str(root), frozenset(parallel_dirs))
+        for future in futures:
+            kept, removed = future.result()
+            kept_bytes += kept
+            removed_bytes += removed
+    return kept_bytes, removed_bytes
 
 
 def _write_file(path: Path, content: str, *, executable: bool = False) -> None:
@@ -232,32 +426,29 @@ exec "${{PYTHON}}" -m azure.cli "$@"
     print(f"Created launcher script: {bin_dir / CLI_EXECUTABLE_NAME}")
 
 
-def _create_package_root(venv_source: Path, *, platform_tag: str, staging_dir: Path) -> Path:
-    """Stage files in the layout they should appear on the target system."""
+def _create_package_root(pkg_root: Path, *, prune_unused: bool = False) -> Path:
+    """Finish staging files in the layout they should appear on the target system.
 
-    # Create the installation structure that mirrors /usr/local
-    pkg_root = staging_dir / "pkg_root"
-    bin_dir = pkg_root / "bin"
-    install_prefix_dir = pkg_root / INSTALL_PREFIX
-    venv_target = install_prefix_dir / APP_NAME
+    The virtual environment is created in place at pkg_root/microsoft/azure-cli and
+    the launcher is written by _prepare_static_assets, so this only trims the
+    environment. With prune_unused, site-packages entries that the smoke test
+    commands never import are removed as well.
+    """
 
-    _ensure_clean([pkg_root])
-    bin_dir.mkdir(parents=True, exist_ok=True)
-    install_prefix_dir.mkdir(parents=True, exist_ok=True)
-
-    # Copy the virtual environment
-    print(f"Copying virtual environment to {venv_target}")
-    print(f"  Source size: {sum(f.stat().st_size for f in venv_source.rglob('*') if f.is_file()) / (1024*1024):.1f} MB")
-    shutil.copytree(venv_source, venv_target, symlinks=False)
+    venv_target = pkg_root / INSTALL_DIR
 
     # Prune bytecode to reduce size
     print("Pruning Python bytecode files...")
-    _prune_bytecode(venv_target)
-    print(f"  Target size: {sum(f.stat().st_size for f in venv_target.rglob('*') if f.is_file()) / (1024*1024):.1f} MB")
+    kept_bytes, removed_bytes = _prune_bytecode(venv_target)
+    print(f"  Removed bytecode: {removed_bytes / (1024*1024):.1f} MB")
+    print(f"  Target size: {kept_bytes / (1024*1024):.1f} MB")
 
-    # Create the launcher script
-    print("Creating system launcher script")
-    _create_system_launcher(bin_dir)
+    if prune_unused:
+        print("Pruning unused site-packages...")
+        _prune_unused_packages(venv_target, pkg_root.parent / "pruned")
+
+    print("Verifying Azure CLI still runs...")
+    _smoke_test(_virtualenv_python(venv_target))
 
     return pkg_root
 
@@ -268,49 +459,85 @@ def _create_distribution_xml(staging_dir: Path, *, version: str, platform_tag: s
     distribution_xml = staging_dir / "distribution.xml"
     component_pkg_name = f"{APP_NAME}-component-{version}-{platform_tag}.pkg"
 
-    # Create distribution XML
-    root = ET.Element("installer-gui-script", minSpecVersion="2")
+    # Package reference must come before choices
+    xml_text = _DIST_TEMPLATE.format(
+        version=escape(version),
+        pkg_id_attr=quoteattr(PKG_IDENTIFIER),
+        component_pkg=escape(component_pkg_name),
+        description_attr=quoteattr(f"Install Azure CLI {version} command-line tool"),
+    )
+    distribution_xml.write_text(xml_text, encoding="utf-8")
 
-    # Title
-    ET.SubElement(root, "title").text = f"Azure CLI {version}"
+    print(f"Created distribution XML: {distribution_xml}")
 
-    # Package reference - this MUST come before choices
-    pkg_ref = ET.SubElement(root, "pkg-ref", id=PKG_IDENTIFIER)
-    pkg_ref.text = component_pkg_name
+    # Debug: Show XML content and verify component package reference
+    print("Distribution XML content:")
+    print(xml_text)
 
-    # Choices outline
-    choices = ET.SubElement(root, "choices-outline")
-    ET.SubElement(choices, "line", choice="azure-cli-choice")
+    return distribution_xml
 
-    # Choice definition
-    choice_elem = ET.SubElement(root, "choice", id="azure-cli-choice", title="Azure CLI")
-    choice_elem.set("description", f"Install Azure CLI {version} command-line tool")
-    choice_elem.set("start_selected", "true")
-    ET.SubElement(choice_elem, "pkg-ref", id=PKG_IDENTIFIER)
 
-    # Write XML with proper formatting
-    tree = ET.ElementTree(root)
-    ET.indent(tree, space="  ", level=0)
-    tree.write(distribution_xml, encoding="utf-8", xml_declaration=True)
+def _prepare_static_assets(pkg_root: Path, staging_dir: Path, *, version: str, platform_tag: str) -> Path:
+    """Write the files that do not depend on the virtual environment.
 
-    print(f"Created distribution XML: {distribution_xml}")
+    Runs while Azure CLI is being installed, so it must only touch pkg_root/bin
+    and staging_dir/distribution.xml. Returns the distribution XML path.
+    """
 
-    # Debug: Show XML content and verify component package reference
-    print("Distribution XML content:")
-    with open(distribution_xml, "r") as f:
-        print(f.read())
-
-    # Verify component package exists in staging directory
-    expected_component = staging_dir / component_pkg_name
-    if expected_component.exists():
-        print(
-            f"✅ Component package found: {expected_component} ({expected_component.stat().st_size / (1024*1024):.1f} MB)"
-        )
-    else:
-        print(f"❌ Component package missing: {expected_component}")
-        print(f"Available files in staging: {list(staging_dir.glob('*.pkg'))}")
+    bin_dir = pkg_root / "bin"
+    bin_dir.mkdir(parents=True, exist_ok=True)
 
-    return distribution_xml
+    # Create the launcher script
+    print("Creating system launcher script")
+    _create_system_launcher(bin_dir)
+
+    # Create distribution XML
+    print("Creating distribution XML...")
+    return _create_distribution_xml(staging_dir, version=version, platform_tag=platform_tag)
+
+
+def _compression_args() -> list[str]:
+    """Select LZFSE payload compression where pkgbuild/productbuild support it (macOS 11+)."""
+    mac_version = platform.mac_ver()[0]
+    try:
+        version = tuple(int(part) for part in mac_version.split(".")[:2])
+    except ValueError:
+        return []
+    # Pythons built against a pre-11 SDK see Big Sur and later as the compatibility version 10.16
+    return ["--compression", "latest"] if version >= (10, 16) else []
+
+
+@functools.lru_cache(maxsize=None)
+def _require_tool(name: str) -> str:
+    """Locate a required build tool on PATH without spawning a subprocess."""
+    path = shutil.which(name)
+    if path is None:
+        raise BuildError(f"{name} not found. Install Xcode Command Line Tools: xcode-select --install")
+    return path
+
+
+def _ensure_component_plist(pkg_root: Path, staging_dir: Path) -> Path:
+    """Get the component plist for pkgbuild, generating it with --analyze if it is missing.
+
+    A generated plist is written to staging_dir rather than the source tree, so
+    the build never changes an input of the package cache fingerprint. Any bundles
+    found are marked non-relocatable so the installer always writes to /usr/local
+    instead of following copies the user may have moved elsewhere.
+    """
+    if COMPONENT_PLIST_PATH.is_file():
+        return COMPONENT_PLIST_PATH
+
+    plist_path = staging_dir / COMPONENT_PLIST_PATH.name
+    print(f"Generating component plist: {plist_path}")
+    _run(["pkgbuild", "--analyze", "--root", str(pkg_root), str(plist_path)])
+    with plist_path.open("rb") as fh:
+        components = plistlib.load(fh)
+    for component in components:
+        component["BundleIsRelocatable"] = False
+    with plist_path.open("wb") as fh:
+        plistlib.dump(components, fh)
+    print(f"  To reuse it, review and commit it as {COMPONENT_PLIST_PATH}")
+    return plist_path
 
 
 def _create_pkg_installer(
@@ -323,32 +550,36 @@ def _create_pkg_installer(
 ) -> Path:
     """Create macOS .pkg installer using pkgbuild + productbuild for enhanced installer."""
 
-    pkg_filename = f"{APP_NAME}-{version}-{platform_tag}.pkg"
-    final_pkg_path = artifacts_dir / pkg_filename
+    final_pkg_path = artifacts_dir / _pkg_filename(version, platform_tag)
     _ensure_clean([final_pkg_path])
 
     # Verify build tools
-    for tool in ["pkgbuild", "productbuild"]:
-        try:
-            _run(["which", tool], capture_output=True)
-        except BuildError:
-            raise BuildError(f"{tool} not found. Install Xcode Command Line Tools: xcode-select --install")
+    for tool in ("pkgbuild", "productbuild"):
+        _require_tool(tool)
+
+    compression_args = _compression_args()
+    print(f"Payload compression: {compression_args[-1] if compression_args else 'default'}")
 
     # Step 1: Create component package
     component_pkg_name = f"{APP_NAME}-component-{version}-{platform_tag}.pkg"
     component_pkg_path = staging_dir / component_pkg_name
 
+    component_plist = _ensure_component_plist(pkg_root, staging_dir)
+
     print(f"Creating component package: {component_pkg_path}")
     cmd = [
         "pkgbuild",
         "--root",
         str(pkg_root),
+        "--component-plist",
+        str(component_plist),
         "--identifier",
         PKG_IDENTIFIER,
         "--version",
         version,
         "--install-location",
         "/usr/local",
+        *compression_args,
         str(component_pkg_path),
     ]
     _run(cmd)
@@ -362,13 +593,11 @@ def _create_pkg_installer(
     if component_size_mb < 1.0:
         print(f"⚠️  WARNING: Component package is unusually small ({component_size_mb:.1f} MB)")
 
-    # Step 2: Create distribution XML
-    print("Creating distribution XML...")
-    _create_distribution_xml(staging_dir, version=version, platform_tag=platform_tag)
-
-    # Step 3: Create distribution package using productbuild
+    # Step 2: Create distribution package using productbuild
     print(f"Creating distribution package: {final_pkg_path}")
     distribution_xml_path = staging_dir / "distribution.xml"
+    if not distribution_xml_path.exists():
+        raise BuildError(f"Distribution XML missing: {distribution_xml_path}")
 
     cmd = [
         "productbuild",
@@ -376,11 +605,17 @@ def _create_pkg_installer(
         str(distribution_xml_path),
         "--package-path",
         str(staging_dir),
+        *compression_args,
         str(final_pkg_path),
     ]
     _run(cmd)
 
-    print(f"Created distribution package: {final_pkg_path} ({final_pkg_path.stat().st_size / (1024*1024):.1f} MB)")
+    final_size_mb = final_pkg_path.stat().st_size / (1024 * 1024)
+    print(f"Created distribution package: {final_pkg_path} ({final_size_mb:.1f} MB)")
+    print(
+        f"Package sizes ({compression_args[-1] if compression_args else 'default'} compression): "
+        f"component {component_size_mb:.1f} MB, final {final_size_mb:.1f} MB"
+    )
 
     # Verify final package
     if not final_pkg_path.exists():
@@ -389,13 +624,52 @@ def _create_pkg_installer(
     return final_pkg_path
 
 
+def _pkg_filename(version: str, platform_tag: str) -> str:
+    """Get the file name of the final distribution package."""
+    return f"{APP_NAME}-{version}-{platform_tag}.pkg"
+
+
+def _fingerprint(version: str, platform_tag: str, *, prune_unused: bool = False) -> str:
+    """Hash everything that determines the package contents into a cache key."""
+    digest = hashlib.sha256()
+    # The venv bundles a copy of the build interpreter, so it is part of the key along with the installer used
+    header = [
+        version,
+        platform_tag,
+        str(prune_unused),
+        sys.version,
+        platform.machine(),
+        str(_uv_executable() is not None),
+    ]
+    digest.update("\0".join(header).encode("utf-8") + b"\0")
+    inputs = [Path(__file__).resolve(), COMPONENT_PLIST_PATH]
+    for component in COMPONENT_DIRS:
+        inputs.extend(component / name for name in ("setup.py", "setup.cfg", "pyproject.toml"))
+    for path in inputs:
+        if path.is_file():
+            digest.update(str(path.relative_to(PROJECT_ROOT)).encode("utf-8"))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _pkg_cache_dir() -> Optional[Path]:
+    """Get the persistent package cache directory, if caching is enabled."""
+    cache_dir = os.environ.get(PKG_CACHE_DIR_ENV)
+    if cache_dir and cache_dir.strip():
+        return Path(cache_dir.strip())
+    return None
+
+
 def _emit_sha256(artifact_path: Path) -> Path:
     """Generate SHA256 checksum file."""
     print(f"Generating SHA256 checksum for {artifact_path.name}...")
-    digest = hashlib.sha256()
     with artifact_path.open("rb") as fh:
-        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
-            digest.update(chunk)
+        if sys.version_info >= (3, 11):
+            digest = hashlib.file_digest(fh, "sha256")
+        else:
+            digest = hashlib.sha256()
+            for chunk in iter(lambda: fh.read(4 * 1024 * 1024), b""):
+                digest.update(chunk)
     checksum_path = artifact_path.with_suffix(artifact_path.suffix + ".sha256")
     checksum_line = f"{digest.hexdigest()}  {artifact_path.name}\n"
     checksum_path.write_text(checksum_line, encoding="utf-8")
@@ -403,29 +677,31 @@ def _emit_sha256(artifact_path: Path) -> Path:
     return checksum_path
 
 
-def build_pkg_installer(*, platform_tag: str) -> None:
-    """Build a .pkg installer for macOS using pkgbuild + productbuild."""
-
-    version = _detect_version()
-    artifacts_dir = PROJECT_ROOT / "dist" / "macos_pkg"
-    artifacts_dir.mkdir(parents=True, exist_ok=True)
-
-    print("=" * 70)
-    print(f"Building Azure CLI {version} for {platform_tag} (.pkg installer)")
-    print("=" * 70)
+def _build_pkg(*, version: str, platform_tag: str, artifacts_dir: Path, prune_unused: bool) -> Path:
+    """Run Phases 1-3: install Azure CLI, stage the package root and create the .pkg."""
 
     with tempfile.TemporaryDirectory(prefix="azure-cli-pkg-build-") as tmp_dir_str:
         tmp_dir = Path(tmp_dir_str)
 
-        # Phase 1: Create virtual environment and install Azure CLI
-        print("\n[Phase 1/4] Creating virtual environment and installing Azure CLI")
-        venv_dir = tmp_dir / "bundle-venv"
-        python_path = _create_virtualenv(venv_dir)
-        _install_azure_cli(python_path)
+        # The installation structure mirrors /usr/local; the venv is built in place
+        pkg_root = tmp_dir / "pkg_root"
+        venv_dir = pkg_root / INSTALL_DIR
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # The launcher and distribution XML don't depend on the venv; write them while pip runs
+            static_assets = executor.submit(
+                _prepare_static_assets, pkg_root, tmp_dir, version=version, platform_tag=platform_tag
+            )
 
-        # Phase 2: Stage package root
-        print("\n[Phase 2/4] Staging package root")
-        pkg_root = _create_package_root(venv_dir, platform_tag=platform_tag, staging_dir=tmp_dir)
+            # Phase 1: Create virtual environment and install Azure CLI
+            print("\n[Phase 1/4] Creating virtual environment and installing Azure CLI")
+            python_path = _create_virtualenv(venv_dir)
+            _install_azure_cli(python_path)
+
+            # Phase 2: Stage package root
+            print("\n[Phase 2/4] Staging package root")
+            _create_package_root(pkg_root, prune_unused=prune_unused)
+            static_assets.result()
 
         # Phase 3: Create .pkg installer
         print("\n[Phase 3/4] Creating .pkg installer")
@@ -437,9 +713,54 @@ def build_pkg_installer(*, platform_tag: str) -> None:
             staging_dir=tmp_dir,
         )
 
-        # Phase 4: Generate checksum
-        print("\n[Phase 4/4] Generating checksum")
-        checksum_path = _emit_sha256(pkg_path)
+    return pkg_path
+
+
+def build_pkg_installer(*, platform_tag: str, prune_unused: bool = False) -> None:
+    """Build a .pkg installer for macOS using pkgbuild + productbuild."""
+
+    version = _detect_version()
+    artifacts_dir = PROJECT_ROOT / "dist" / "macos_pkg"
+    artifacts_dir.mkdir(parents=True, exist_ok=True)
+
+    print("=" * 70)
+    print(f"Building Azure CLI {version} for {platform_tag} (.pkg installer)")
+    print("=" * 70)
+
+    cache_dir = _pkg_cache_dir()
+    cached_pkg = None
+    if cache_dir:
+        fingerprint = _fingerprint(version, platform_tag, prune_unused=prune_unused)
+        cached_pkg = cache_dir / f"{fingerprint}.pkg"
+        print(f"Package cache: {cached_pkg}")
+
+    if cached_pkg and cached_pkg.is_file():
+        # Skip Phases 1-3 when nothing that affects the package has changed
+        print("\n[Phase 1-3/4] Reusing cached .pkg installer")
+        pkg_path = artifacts_dir / _pkg_filename(version, platform_tag)
+        _ensure_clean([pkg_path])
+        shutil.copy2(cached_pkg, pkg_path)
+    else:
+        pkg_path = _build_pkg(
+            version=version, platform_tag=platform_tag, artifacts_dir=artifacts_dir, prune_unused=prune_unused
+        )
+        if cached_pkg:
+            cached_pkg.parent.mkdir(parents=True, exist_ok=True)
+            # Copy under a unique temporary name and rename, so an interrupted or concurrent
+            # build can never leave a truncated <fingerprint>.pkg that later runs would trust
+            fd, tmp_name = tempfile.mkstemp(prefix=f"{cached_pkg.name}.", suffix=".tmp", dir=cached_pkg.parent)
+            os.close(fd)
+            try:
+                shutil.copy2(pkg_path, tmp_name)
+                os.replace(tmp_name, cached_pkg)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+            print(f"Stored package in cache: {cached_pkg}")
+
+    # Phase 4: Generate checksum
+    print("\n[Phase 4/4] Generating checksum")
+    checksum_path = _emit_sha256(pkg_path)
 
     # Print summary
     print("\n" + "=" * 70)
@@ -474,6 +795,11 @@ def parse_args(argv: Optional[Iterable[str]] = None) -> argparse.Namespace:
         choices=["macos-arm64", "macos-x86_64"],
         help="Target platform architecture",
     )
+    parser.add_argument(
+        "--prune-unused",
+        action="store_true",
+        help="Remove site-packages that the smoke test commands never import",
+    )
     return parser.parse_args(list(argv) if argv is not None else None)
 
 
@@ -482,7 +808,7 @@ def main(argv: Optional[Iterable[str]] = None) -> None:
     args = parse_args(argv)
 
     try:
-        build_pkg_installer(platform_tag=args.platform_tag)
+        build_pkg_installer(platform_tag=args.platform_tag, prune_unused=args.prune_unused)
     except BuildError as exc:
         print(f"\n❌ ERROR: {exc}", file=sys.stderr)
         sys.exit(1)